@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, infer_types=True
+"""
+Ahead-of-time compiled scalar Sellmeier evaluation.
+A Sellmeier object binds one reduced coefficient set in the common form returned by
+CrystalData._reduced_poles; its n_squared method is used for scalar queries when this
+extension has been built.
+"""
+
+cdef enum:
+    MAX_POLES = 3
+
+
+cdef class Sellmeier:
+    """n^2(wvl) = C + sum_i AB_i / (wvl^2 - B_i) + D * wvl^2, with up to three poles."""
+    cdef double C, D
+    cdef double AB[MAX_POLES]
+    cdef double B[MAX_POLES]
+    cdef int poles
+
+    def __cinit__(self, double C, AB, B, double D=0.0):
+        if len(AB) != len(B) or len(AB) > MAX_POLES:
+            raise ValueError(f"Expected matching AB and B of at most {MAX_POLES} poles")
+        self.C = C
+        self.D = D
+        self.poles = 0
+        for ab, b in zip(AB, B):
+            # zero terms are dropped, as in the generated Python fallback
+            if ab != 0.0:
+                self.AB[self.poles] = ab
+                self.B[self.poles] = b
+                self.poles += 1
+
+    cpdef double n_squared(self, double wvl):
+        cdef double w2 = wvl * wvl
+        cdef double n2 = self.C
+        cdef int i
+        for i in range(self.poles):
+            n2 += self.AB[i] / (w2 - self.B[i])
+        if self.D != 0.0:
+            n2 += self.D * w2
+        return n2
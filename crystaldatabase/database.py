@@ -1,22 +1,183 @@
 from abc import ABC, abstractmethod
+from functools import cache, wraps
+from math import sqrt
 import numpy as np
-from sympy import symbols, Matrix
+
+__all__ = ["CrystalData", "LiNbO3", "BaMgF4", "SiO2", "KH2PO4", "CRYSTALS", "CRYSTAL_TABLE", "get_n_all"]
+
+try:
+    from . import _sellmeier_c
+except ImportError:  # the Cython extension is optional; scalar queries then use _specialized_sellmeier
+    _sellmeier_c = None
+
+
+def _lazy_njit(func):
+    """
+    Compile func with numba on its first call rather than at import. Only array queries
+    reach these kernels, so scalar-only use never imports numba.
+    """
+    compiled = None
+
+    @wraps(func)
+    def kernel(*args):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                from numba import njit
+            except ImportError:  # numba is optional; kernels then run as plain NumPy
+                compiled = func
+            else:
+                compiled = njit(cache=True, fastmath=True)(func)
+        return compiled(*args)
+    return kernel
+
+
+# -----------------
+# Sellmeier kernels
+# Pure arithmetic on floats (or arrays of them), compiled on first use and cached on
+# disk when numba is available. Each kernel takes the reduced coefficient set of its
+# crystal (see _reduce_coefficients): every A * w2 / (w2 - B) term is rewritten as
+# A + A*B / (w2 - B), with the constants folded into C, so a pole costs one
+# subtraction and one division. The terms are independent temporaries so their
+# divisions can be issued in parallel rather than along one dependency chain.
+@_lazy_njit
+def _linbo3_sellmeier(wvl, C, AB1, B1, AB2, B2, AB3, B3):
+    w2 = wvl * wvl
+    t1 = AB1 / (w2 - B1)
+    t2 = AB2 / (w2 - B2)
+    t3 = AB3 / (w2 - B3)
+    return C + t1 + t2 + t3
+
+
+@_lazy_njit
+def _bamgf4_sellmeier(wvl, C, AB1, B1, AB2, B2, D):
+    w2 = wvl * wvl
+    t1 = AB1 / (w2 - B1)
+    t2 = AB2 / (w2 - B2)
+    t3 = D * w2
+    return C + t1 + t2 + t3
+
+
+# shared by every crystal whose reduced form is two poles and a constant (SiO2, KH2PO4)
+@_lazy_njit
+def _two_pole_sellmeier(wvl, C, AB1, B1, AB2, B2):
+    w2 = wvl * wvl
+    t1 = AB1 / (w2 - B1)
+    t2 = AB2 / (w2 - B2)
+    return C + t1 + t2
+
+
+@cache
+def _specialized_sellmeier(C, AB, B, D):
+    """
+    Generate n^2(wvl) for one reduced coefficient set, with every coefficient written into
+    the source as a literal. Zero terms are dropped and CPython folds the constants, so a
+    call is just the remaining arithmetic. Cached per coefficient set, i.e. per crystal axis.
+    """
+    terms = [repr(C)]
+    terms += [f"{ab!r} / (w2 - {b!r})" for ab, b in zip(AB, B) if ab != 0.0]
+    if D != 0.0:
+        terms.append(f"{D!r} * w2")
+    source = "def _sellmeier(wvl):\n" \
+             "    w2 = wvl * wvl\n" \
+             f"    return {' + '.join(terms)}\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["_sellmeier"]
+
+
+# Python and NumPy real scalars, which get_n evaluates without any array handling
+_REAL_SCALARS = (int, float, np.integer, np.floating)
+# polarizations given as one name or one angle (hashable, so get_n can memoize them)
+_SCALAR_POLARIZATIONS = (str, *_REAL_SCALARS)
+
+# principal plane used by a biaxial {axis, degree} polarization: tilt from axis toward this one
+_BIAXIAL_TILT = {"a": "b", "b": "c", "c": "a"}
+
+
+@cache
+def _cached_d_matrix(crystal_cls, kleinmann):
+    return crystal_cls._build_d_matrix(kleinmann)
 
 
 class CrystalData(ABC):
+    # every crystal carries the same per-instance state; subclasses add no slots
+    __slots__ = ("name", "point_group", "sellmeier", "reference",
+                 "_coeff", "_coeff_oe", "_pol_dispatch", "_scalar_dispatch", "_n_cache",
+                 "_range_min", "_range_max")
+    _N_CACHE_SIZE = 4096
+
     @abstractmethod
     def _sellmeier_eq(wavelength_um, coefficient, polarization="independent"):
         """
         Inplement respectively in each material class.
+        coefficient is a reduced set returned by _reduce_coefficients.
         polarization needs to be specified only when sellmeier eq. looks different between o/e.
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def _reduce_coefficients(coefficient):
+        """
+        Inplement respectively in each material class.
+        Turn a coefficient set of self.sellmeier into the float64 array taken by _sellmeier_eq.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _reduced_poles(coefficient):
+        """
+        Inplement respectively in each material class.
+        View a reduced coefficient set in the common form
+            n^2 = C + sum_i AB_i / (w^2 - B_i) + D * w^2
+        and return (C, (AB_i, ...), (B_i, ...), D) as Python floats.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _sellmeier_poles(coefficient):
+        """
+        Inplement respectively in each material class.
+        Rewrite a coefficient set in the common form
+            n^2 = C + sum_i A_i * w^2 / (w^2 - B_i) + D * w^2
+        and return (C, (A_i, ...), (B_i, ...), D). Used to build the cross-crystal table.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _build_d_matrix(kleinmann):
+        """
+        Inplement respectively in each material class.
+        Return the contracted (3x6) d tensor as a sympy matrix, with or without Kleinmann symmetry.
+        """
+        pass
+
+    def d_matrix(self, kleinmann=True):
+        """
+        Return the contracted (3x6) d tensor. SymPy is imported on first use and
+        the matrix is built once per class.
+        """
+        return _cached_d_matrix(type(self), kleinmann)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # axiality is fixed by the crystal system, so resolve it once per class
+        if "crystal_system" in cls.__dict__:
+            cls.axiality = cls._resolve_axiality(cls.crystal_system)
+
     def get_axiality(self):
         """
         Return optical axiality ('isotropic', 'uniaxial', 'biaxial') based on self.system
         """
-        system = self.crystal_system.lower()
+        return self._resolve_axiality(self.crystal_system)
+
+    @staticmethod
+    def _resolve_axiality(crystal_system):
+        system = crystal_system.lower()
         if system in {"cubic"}:
             return "isotropic"
         elif system in {"tetragonal", "hexagonal", "trigonal", "rhombohedral"}:
@@ -31,200 +192,355 @@ class CrystalData(ABC):
         """
         parameters
         ----------------------
-        wavelength_nm: float
+        wavelength_nm: float or array-like
+            Scalars give a float; arrays are forwarded to get_n_spectrum.
         polarization:
             "iso",
             "o", "e", degree (float), 
             "a", "b", "c", {axis: a or b or c, degree: (float)}
+            For the dict form the wave vector lies in a principal plane, tilted by degree
+            from axis toward the next axis (a -> b -> c -> a); the index of the wave
+            polarized in that plane is returned (degree=0: n of the next axis, 90: n of axis).
         ref:
             None (as default) or a key string to choose a Sellmeier set.
+
+        Scalar queries are memoized per instance (FIFO, up to _N_CACHE_SIZE entries).
+        """
+        # look up the raw arguments before any conversion; only validated scalar keys are
+        # ever stored, and equal numbers hash alike (1064 == 1064.0 == np.float64(1064))
+        try:
+            n = self._n_cache.get((wavelength_nm, polarization))
+        except TypeError:  # unhashable: arrays, lists or dict polarizations
+            n = None
+        if n is not None:
+            return n
+
+        # np.ndim costs about as much as a scalar evaluation, so plain numbers skip it
+        if not isinstance(wavelength_nm, _REAL_SCALARS) and np.ndim(wavelength_nm) != 0:
+            return self.get_n_spectrum(wavelength_nm, polarization)
+        wavelength_nm = float(wavelength_nm)  # also unwraps 0-d arrays, which are unhashable
+        if not isinstance(polarization, _SCALAR_POLARIZATIONS):
+            # dicts or arrays of angles: not hashable, so not memoized
+            return self._get_n_single_wavelength(wavelength_nm, polarization)
+
+        if len(self._n_cache) >= self._N_CACHE_SIZE:
+            del self._n_cache[next(iter(self._n_cache))]
+        n = self._n_cache[wavelength_nm, polarization] = self._get_n_scalar(wavelength_nm, polarization)
+        return n
+
+    def _get_n_single_wavelength(self, wavelength_nm, polarization):
+        """
+        Evaluate one wavelength through get_n_spectrum; a float unless polarization
+        carries several angles, in which case the array of n is returned.
+        """
+        n = self.get_n_spectrum(np.array([wavelength_nm]), polarization)
+        return float(n[0]) if n.size == 1 else n
+
+    def _get_n_scalar(self, wavelength_nm, polarization):
+        """
+        Scalar fast path of get_n: plain float arithmetic and math.sqrt for the principal
+        polarizations, avoiding 1-element arrays and ufunc dispatch.
+        """
+        if not isinstance(polarization, str):
+            return self._get_n_single_wavelength(wavelength_nm, polarization)
+        wvl = wavelength_nm * 1e-3  # μm
+        if not (self._range_min <= wvl <= self._range_max):
+            raise ValueError(f"Wavelength out of approximation range: {self._range_min}-{self._range_max} um")
+        return sqrt(self._lookup_polarization(self._scalar_dispatch, polarization)(wvl))
+
+    def n_eff_angle(self, wavelength_nm, theta_deg):
+        """
+        Effective index of a uniaxial crystal at a single wavelength for a scan of angles.
+
+        parameters
+        ----------------------
+        wavelength_nm: float
+        theta_deg: float or array-like
+            angle between the wave vector and the optic axis, in degree.
         """
-        wvl = wavelength_nm / 1e3  # μm
-        range_min = self.sellmeier["range"][0]
-        range_max = self.sellmeier["range"][1]
-        if wvl < range_min or wvl > range_max:
-            raise ValueError(f"Wavelength out of approximation range: {range_min}-{range_max} um")
+        if self.axiality != "uniaxial":
+            raise ValueError(f"Angle-dependent index is defined here for uniaxial crystals only: {self.name}")
+        n_o = self.get_n(wavelength_nm, "o")
+        n_e = self.get_n(wavelength_nm, "e")
+        return self._n_eff(n_o, n_e, theta_deg)
+
+    @staticmethod
+    def _n_eff(n_o, n_e, theta_deg):
+        # 1/n_eff^2 = cos^2/n_o^2 + sin^2/n_e^2 = 1/n_o^2 + sin^2 * (1/n_e^2 - 1/n_o^2)
+        s = np.sin(np.radians(theta_deg))
+        inv_no2 = 1.0 / (n_o*n_o)
+        inv_ne2 = 1.0 / (n_e*n_e)
+        return 1.0 / np.sqrt(inv_no2 + s*s*(inv_ne2 - inv_no2))
+
+    def _lookup_polarization(self, table, polarization):
+        try:
+            return table[polarization]
+        except KeyError:
+            raise ValueError(f"Unknown polarization for {self.axiality} crystal: {polarization}") from None
+
+    def get_n_spectrum(self, wavelengths_nm, polarization='unpolarized'):
+        """
+        Refractive index over a whole wavelength grid in one vectorized pass.
+
+        parameters
+        ----------------------
+        wavelengths_nm: array-like
+        polarization:
+            same as get_n. A degree may also be an array broadcastable against wavelengths_nm.
+
+        returns
+        ----------------------
+        np.ndarray of n, at least 1-D.
+        """
+        wvl = np.atleast_1d(np.asarray(wavelengths_nm, dtype=np.float64)) * 1e-3  # μm
+        if wvl.size == 0:
+            raise ValueError("No wavelength given")
+        if not (self._range_min <= wvl.min() and wvl.max() <= self._range_max):
+            raise ValueError(f"Wavelength out of approximation range: {self._range_min}-{self._range_max} um")
         # n_squared = 1 + self.constant
         # for A, B in self.coefficients:
         #     n_squared += A * λ**2 / (λ**2 - B)
-        
-        if self.axiality == "isotropic":
-            coeff =  self.sellmeier["iso"]
-            n_squared = self._sellmeier_eq(wvl, coeff)
-            n = np.sqrt(n_squared)
-            return n
 
-        elif self.axiality =="uniaxial":
-            coeff_o = self.sellmeier["o"]
-            coeff_e = self.sellmeier["e"]
-            n_o_squared = self._sellmeier_eq(wvl, coeff_o)
-            n_e_squared = self._sellmeier_eq(wvl, coeff_e)
-            n_o = np.sqrt(n_o_squared)
-            n_e = np.sqrt(n_e_squared)
-
-            if polarization == "o":
-                return n_o
-            elif polarization == "e":
-                return n_e
-            elif type(polarization) == "float":
-                theta = np.radians(polarization)
-                n_eff = n_o*n_e / np.sqrt((n_o**2)*(np.sin(theta)**2) + (n_e**2)*(np.cos(theta)**2))
-                return n_eff
-            else:
-                raise ValueError(f"Polarization for uniaxial crystal has to be 'o/e' or degree from optic axis: {polarization}")
+        if isinstance(polarization, str):
+            n_squared = self._sellmeier_eq(wvl, self._lookup_polarization(self._pol_dispatch, polarization))
+            return np.sqrt(n_squared, out=n_squared)
+
+        if isinstance(polarization, (list, tuple)):
+            polarization = np.asarray(polarization, dtype=np.float64)
+
+        if self.axiality == "uniaxial":
+            if isinstance(polarization, (int, float, np.integer, np.floating, np.ndarray)):
+                # o and e share wvl: evaluate both in one pass on the (o, e) lanes of _coeff_oe
+                n_oe = self._sellmeier_eq(wvl[..., np.newaxis], self._coeff_oe)
+                np.sqrt(n_oe, out=n_oe)
+                return self._n_eff(n_oe[..., 0], n_oe[..., 1], polarization)
+            raise ValueError(f"Polarization for uniaxial crystal has to be 'o/e' or degree from optic axis: {polarization}")
 
         elif self.axiality == "biaxial":
-            coeff_a = self.sellmeier["a"]
-            coeff_b = self.sellmeier["b"]
-            coeff_c = self.sellmeier["c"]
-            n_a_squared = self._sellmeier_eq(wvl, coeff_a)
-            n_b_squared = self._sellmeier_eq(wvl, coeff_b)
-            n_c_squared = self._sellmeier_eq(wvl, coeff_c)
-            n_a = np.sqrt(n_a_squared)
-            n_b = np.sqrt(n_b_squared)
-            n_c = np.sqrt(n_c_squared)
-
-            if polarization == "a":
-                return n_a
-            elif polarization == "b":
-                return n_b
-            elif polarization == "c":
-                return n_c
-            elif type(polarization) == dict:
-                if polarization["axis"] == "a":
-                    theta = np.radians(polarization["degree"])
+            if isinstance(polarization, dict):
+                # only the two axes spanning the plane are evaluated
+                axis = polarization.get("axis")
+                if axis not in _BIAXIAL_TILT:
+                    raise ValueError(f"Axis for biaxial crystal has to be 'a/b/c': {axis}")
+                if "degree" not in polarization:
+                    raise ValueError(f"Polarization for biaxial crystal needs a degree with the axis: {polarization}")
+                n_axis = np.sqrt(self._sellmeier_eq(wvl, self._pol_dispatch[axis]))
+                n_next = np.sqrt(self._sellmeier_eq(wvl, self._pol_dispatch[_BIAXIAL_TILT[axis]]))
+                return self._n_eff(n_next, n_axis, polarization["degree"])
+            raise ValueError(f"Polarization for biaxial crystal has to be 'a/b/c' or {{axis, degree}}: {polarization}")
 
+        raise ValueError(f"Polarization for isotropic crystal has to be 'iso': {polarization}")
+
+    def _setup_evaluation(self):
+        """
+        Precompute the per-instance evaluation state from self.sellmeier.
+        Call at the end of each subclass __init__.
+        """
+        self._range_min, self._range_max = (float(limit) for limit in self.sellmeier["range"])
+        self._coeff = {axis: self._reduce_coefficients(coeff)
+                       for axis, coeff in self.sellmeier.items() if axis != "range"}
+        if self.axiality == "uniaxial":
+            self._coeff_oe = np.stack([self._coeff["o"], self._coeff["e"]], axis=-1)
+        # principal polarization -> reduced coefficient set (array path) and
+        # -> n^2(wvl) for a float wvl (scalar path)
+        axes = self._polarization_axes()
+        self._pol_dispatch = {pol: tuple(self._coeff[axis].tolist()) for pol, axis in axes.items()}
+        self._scalar_dispatch = {pol: self._scalar_evaluator(axis) for pol, axis in axes.items()}
+        self._n_cache = {}
+
+    def _polarization_axes(self):
+        """
+        Map each principal polarization ("iso" / "o", "e" / "a", "b", "c") to its Sellmeier axis.
+        """
+        if self.axiality == "isotropic":
+            return {"iso": "iso", "unpolarized": "iso"}
+        elif self.axiality == "uniaxial":
+            return {"o": "o", "e": "e"}
+        return {"a": "a", "b": "b", "c": "c"}
+
+    def _scalar_evaluator(self, axis):
+        """
+        Return n^2(wvl) of one axis for scalar queries: the bound method of a compiled
+        Sellmeier object when the extension is built, otherwise a function specialized to
+        this axis's coefficients. Either way the coefficients are bound once, here.
+        """
+        poles = self._reduced_poles(self._coeff[axis].tolist())
+        if _sellmeier_c is not None:
+            return _sellmeier_c.Sellmeier(*poles).n_squared
+        return _specialized_sellmeier(*poles)
 
 # -----------------
 class LiNbO3(CrystalData):
+    __slots__ = ()
+    crystal_system = "trigonal"
+
     def __init__(self):
         self.name = "LiNbO3"
-        self.crystal_system = "trigonal"
-        self.axiality = self.get_axiality()
         self.point_group = "3m"
-        d_15, d_22, d_31, d_33 = symbols("d_15 d_22 d_31 d_33")
-        self.d_matrix = lambda kleinmann=True: Matrix([
-            [0, 0, 0, 0,  d_15, -d_22],
-            [-d_22, d_22, 0, d_15, 0,  0],
-            [d_31, d_31, d_33, 0, 0, 0]
-        ]) if not kleinmann else Matrix([
-            [0, 0, 0, 0,  d_31, -d_22],
-            [-d_22, d_22, 0, d_31, 0,  0],
-            [d_31, d_31, d_33, 0, 0, 0]
-        ])
-
-        self.sellmeier = {"o" : [1, 2.6734, 0.001764, 1.2290, 0.05914, 12.614, 474.60],
-                          "e" : [1, 2.9804, 0.02047, 0.5981, 0.0666, 8.9543, 416.08], 
+        self.sellmeier = {"o" : np.array([1, 2.6734, 0.001764, 1.2290, 0.05914, 12.614, 474.60], dtype=np.float64),
+                          "e" : np.array([1, 2.9804, 0.02047, 0.5981, 0.0666, 8.9543, 416.08], dtype=np.float64), 
                           "range" : [0.4, 5.0]}
         
         self.reference = {"crystal_system": "https://next-gen.materialsproject.org/materials/mp-552588?formula=LiNbO3",
                           "refractive_index": "https://refractiveindex.info/?shelf=main&book=LiNbO3&page=Zelmon-o"
         }
+        self._setup_evaluation()
         
+    @staticmethod
+    def _build_d_matrix(kleinmann):
+        from sympy import symbols, ImmutableMatrix
+        d_15, d_22, d_31, d_33 = symbols("d_15 d_22 d_31 d_33")
+        if not kleinmann:
+            return ImmutableMatrix([
+                [0, 0, 0, 0,  d_15, -d_22],
+                [-d_22, d_22, 0, d_15, 0,  0],
+                [d_31, d_31, d_33, 0, 0, 0]
+            ])
+        return ImmutableMatrix([
+            [0, 0, 0, 0,  d_31, -d_22],
+            [-d_22, d_22, 0, d_31, 0,  0],
+            [d_31, d_31, d_33, 0, 0, 0]
+        ])
+
     def _sellmeier_eq(self, wavelength_um, coefficient, polarization="independent"):
-        wvl = wavelength_um
-        coeff = coefficient
-        n_squared = coeff[0] + \
-            (coeff[1] * wvl**2 /(wvl**2 - coeff[2])) + \
-            (coeff[3] * wvl**2 /(wvl**2 - coeff[4])) + \
-            (coeff[5] * wvl**2 /(wvl**2 - coeff[6]))
-        return n_squared
+        return _linbo3_sellmeier(wavelength_um, *coefficient)
+
+
+    @staticmethod
+    def _reduce_coefficients(coefficient):
+        c0, A1, B1, A2, B2, A3, B3 = coefficient
+        return np.array([c0 + A1 + A2 + A3, A1*B1, B1, A2*B2, B2, A3*B3, B3], dtype=np.float64)
+
+    @staticmethod
+    def _reduced_poles(coefficient):
+        C, AB1, B1, AB2, B2, AB3, B3 = coefficient
+        return C, (AB1, AB2, AB3), (B1, B2, B3), 0.0
+
+    @staticmethod
+    def _sellmeier_poles(coefficient):
+        c0, A1, B1, A2, B2, A3, B3 = coefficient
+        return c0, (A1, A2, A3), (B1, B2, B3), 0.0
     
 # -----------------
 class BaMgF4(CrystalData):
+    __slots__ = ()
+    crystal_system = "orthorhombic"
+
     def __init__(self):
         self.name = "BaMgF4"
-        self.crystal_system = "orthorhombic"
-        self.axiality = self.get_axiality()
         self.point_group = "mm2"
-        d_15, d_24, d_31, d_32, d_33 = symbols("d_15 d_24 d_31 d_32 d_33")
-        self.d_matrix = lambda kleinmann=True: Matrix([
-            [0, 0, 0, 0,  d_15, 0],
-            [0, 0, 0, d_24, 0,  0],
-            [d_31, d_32, d_33, 0, 0, 0]
-        ]) if not kleinmann else Matrix([
-            [0, 0, 0, 0,  d_31, 0],
-            [0, 0, 0, d_32, 0,  0],
-            [d_31, d_32, d_33, 0, 0, 0]
-        ])
-
-        self.sellmeier = {"a" : [2.1479, 0.00726962, 0.00965209, 8.10153, 1394.25, 0.00320462],
-                          "b" : [2.07977, 0.00650243, 0.0100106, 8.18289, 1451.04, 0.00321466], 
-                          "c" : [2.1285, 0.00704687, 0.00999784, 8.56752, 1413.17, 0.00331969],
+        self.sellmeier = {"a" : np.array([2.1479, 0.00726962, 0.00965209, 8.10153, 1394.25, 0.00320462], dtype=np.float64),
+                          "b" : np.array([2.07977, 0.00650243, 0.0100106, 8.18289, 1451.04, 0.00321466], dtype=np.float64), 
+                          "c" : np.array([2.1285, 0.00704687, 0.00999784, 8.56752, 1413.17, 0.00331969], dtype=np.float64),
                           "range" : [0.15, 10.0]} # rough assumption from graphs on the papaer
         
         self.reference = {"crystal_system": "https://next-gen.materialsproject.org/materials/mp-14568?formula=BaMgF4",
                           "refractive_index": "https://doi.org/10.1364/OE.17.012362"
         }
+        self._setup_evaluation()
         
+    @staticmethod
+    def _build_d_matrix(kleinmann):
+        from sympy import symbols, ImmutableMatrix
+        d_15, d_24, d_31, d_32, d_33 = symbols("d_15 d_24 d_31 d_32 d_33")
+        if not kleinmann:
+            return ImmutableMatrix([
+                [0, 0, 0, 0,  d_15, 0],
+                [0, 0, 0, d_24, 0,  0],
+                [d_31, d_32, d_33, 0, 0, 0]
+            ])
+        return ImmutableMatrix([
+            [0, 0, 0, 0,  d_31, 0],
+            [0, 0, 0, d_32, 0,  0],
+            [d_31, d_32, d_33, 0, 0, 0]
+        ])
+
     def _sellmeier_eq(self, wavelength_um, coefficient, polarization="independent"):
-        wvl = wavelength_um
-        coeff = coefficient
-        n_squared = coeff[0] + \
-            (coeff[1] /(wvl**2 - coeff[2])) + \
-            (coeff[3] * wvl**2 /(wvl**2 - coeff[4])) + \
-            (coeff[5] * wvl**2)
-        return n_squared
+        return _bamgf4_sellmeier(wavelength_um, *coefficient)
+
+
+    @staticmethod
+    def _reduce_coefficients(coefficient):
+        c0, A1, B1, A2, B2, D = coefficient
+        return np.array([c0 + A2, A1, B1, A2*B2, B2, D], dtype=np.float64)
+
+    @staticmethod
+    def _reduced_poles(coefficient):
+        C, AB1, B1, AB2, B2, D = coefficient
+        return C, (AB1, AB2), (B1, B2), D
+
+    @staticmethod
+    def _sellmeier_poles(coefficient):
+        c0, A1, B1, A2, B2, D = coefficient
+        # A1 / (w2 - B1) == (A1/B1) * w2 / (w2 - B1) - A1/B1
+        return c0 - A1/B1, (A1/B1, A2), (B1, B2), D
 
 
 
     
 # -----------------
 class SiO2(CrystalData):
+    __slots__ = ()
+    crystal_system = "trigonal"
+
     def __init__(self):
         self.name = "SiO2"
-        self.crystal_system = "trigonal"
-        self.axiality = self.get_axiality()
         self.point_group = "32"
-        d_11, d_14 = symbols("d_11 d_14")
-        self.d_matrix = lambda kleinmann=True: Matrix([
-            [d_11, -d_11, 0, d_14, 0, 0],
-            [0, 0, 0, 0, -d_14,  d_11],
-            [0, 0, 0, 0, 0, 0]
-        ]) if not kleinmann else Matrix([
-            [d_11, -d_11, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0,  d_11],
-            [0, 0, 0, 0, 0, 0]
-        ])
-
-        self.sellmeier = {"o": [1, 0.28604141, 1.07044083, 1.00585997e-2, 1.10202242, 100],
-                          "e": [1, 0.28851804, 1.09509924, 1.02101864e-2, 1.15662475, 100],
+        self.sellmeier = {"o": np.array([1, 0.28604141, 1.07044083, 1.00585997e-2, 1.10202242, 100], dtype=np.float64),
+                          "e": np.array([1, 0.28851804, 1.09509924, 1.02101864e-2, 1.15662475, 100], dtype=np.float64),
                           "range" : [0.198, 2.05]} 
         
         self.reference = {"crystal_system": "https://next-gen.materialsproject.org/materials/mp-7000?formula=SiO2",
                           "refractive_index": "https://doi.org/10.1364/OE.17.012362https://refractiveindex.info/?shelf=main&book=SiO2&page=Ghosh-o"
         }
+        self._setup_evaluation()
         
+    @staticmethod
+    def _build_d_matrix(kleinmann):
+        from sympy import symbols, ImmutableMatrix
+        d_11, d_14 = symbols("d_11 d_14")
+        if not kleinmann:
+            return ImmutableMatrix([
+                [d_11, -d_11, 0, d_14, 0, 0],
+                [0, 0, 0, 0, -d_14,  d_11],
+                [0, 0, 0, 0, 0, 0]
+            ])
+        return ImmutableMatrix([
+            [d_11, -d_11, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0,  d_11],
+            [0, 0, 0, 0, 0, 0]
+        ])
+
     def _sellmeier_eq(self, wavelength_um, coefficient, polarization="independent"):
-        wvl = wavelength_um
-        coeff = coefficient
-        n_squared = coeff[0] + \
-            coeff[1] + \
-            (coeff[2] * wvl**2 /(wvl**2 - coeff[3])) + \
-            (coeff[4] * wvl**2 /(wvl**2 - coeff[5]))
-        return n_squared
+        return _two_pole_sellmeier(wavelength_um, *coefficient)
+
+
+    @staticmethod
+    def _reduce_coefficients(coefficient):
+        c0, c1, A1, B1, A2, B2 = coefficient
+        return np.array([c0 + c1 + A1 + A2, A1*B1, B1, A2*B2, B2], dtype=np.float64)
+
+    @staticmethod
+    def _reduced_poles(coefficient):
+        C, AB1, B1, AB2, B2 = coefficient
+        return C, (AB1, AB2), (B1, B2), 0.0
+
+    @staticmethod
+    def _sellmeier_poles(coefficient):
+        c0, c1, A1, B1, A2, B2 = coefficient
+        return c0 + c1, (A1, A2), (B1, B2), 0.0
     
 
 
     
 # -----------------
 class KH2PO4(CrystalData):
+    __slots__ = ()
+    crystal_system = "tetragonal"
+
     def __init__(self):
         self.name = "KH2PO4"
-        self.crystal_system = "tetragonal"
-        self.axiality = self.get_axiality()
         self.point_group = "42m"
-        d_14, d_36 = symbols("d_14 d_36")
-        self.d_matrix = lambda kleinmann=True: Matrix([
-            [0, 0, 0, d_14, 0, 0],
-            [0, 0, 0, 0, d_14, 0],
-            [0, 0, 0, 0, 0, d_36]
-        ]) if not kleinmann else Matrix([
-            [0, 0, 0, d_14, 0, 0],
-            [0, 0, 0, 0, d_14, 0],
-            [0, 0, 0, 0, 0, d_14]
-        ])
-
         # self.sellmeier = {
         #     "Zernike_1964":{
         #         "o": [2.259276, 13.00522, 400, 0.01008956, 0.0129426],
@@ -239,8 +555,8 @@ class KH2PO4(CrystalData):
         # }
 
         # "https://refractiveindex.info/?shelf=main&book=KH2PO4&page=Zernike-o"
-        self.sellmeier = {"o": [2.259276, 13.00522, 400, 0.01008956, 0.0129426],
-                          "e": [2.132668, 3.2279924, 400, 0.008637494, 0.0122810],
+        self.sellmeier = {"o": np.array([2.259276, 13.00522, 400, 0.01008956, 0.0129426], dtype=np.float64),
+                          "e": np.array([2.132668, 3.2279924, 400, 0.008637494, 0.0122810], dtype=np.float64),
                           "range" : [0.214, 1.53]} 
 
         # https://doi.org/10.1063/1.4832225
@@ -255,15 +571,43 @@ class KH2PO4(CrystalData):
                               "Lili_2013": "https://doi.org/10.1063/1.4832225"
                           }
         }
+        self._setup_evaluation()
         
+    @staticmethod
+    def _build_d_matrix(kleinmann):
+        from sympy import symbols, ImmutableMatrix
+        d_14, d_36 = symbols("d_14 d_36")
+        if not kleinmann:
+            return ImmutableMatrix([
+                [0, 0, 0, d_14, 0, 0],
+                [0, 0, 0, 0, d_14, 0],
+                [0, 0, 0, 0, 0, d_36]
+            ])
+        return ImmutableMatrix([
+            [0, 0, 0, d_14, 0, 0],
+            [0, 0, 0, 0, d_14, 0],
+            [0, 0, 0, 0, 0, d_14]
+        ])
+
     def _sellmeier_eq(self, wavelength_um, coefficient, polarization="independent"):
-        wvl = wavelength_um
-        coeff = coefficient
+        return _two_pole_sellmeier(wavelength_um, *coefficient)
+
+
+    @staticmethod
+    def _reduce_coefficients(coefficient):
+        c0, A1, B1, A2, B2 = coefficient
+        return np.array([c0 + A1, A1*B1, B1, A2, B2], dtype=np.float64)
 
-        n_squared = coeff[0] + \
-            (coeff[1] * wvl**2 /(wvl**2 - coeff[2])) + \
-            (coeff[3] /(wvl**2 - coeff[4]))
-        return n_squared
+    @staticmethod
+    def _reduced_poles(coefficient):
+        C, AB1, B1, AB2, B2 = coefficient
+        return C, (AB1, AB2), (B1, B2), 0.0
+
+    @staticmethod
+    def _sellmeier_poles(coefficient):
+        c0, A1, B1, A2, B2 = coefficient
+        # A2 / (w2 - B2) == (A2/B2) * w2 / (w2 - B2) - A2/B2
+        return c0 - A2/B2, (A1, A2/B2), (B1, B2), 0.0
 
 
 """
@@ -274,4 +618,75 @@ CRYSTALS = {
     "BaMgF4": BaMgF4,
     "SiO2": SiO2,
     "KH2PO4": KH2PO4
-}
\ No newline at end of file
+}
+
+
+"""
+cross-crystal Sellmeier table
+One row per (crystal, principal axis), coefficients stored as parallel arrays (SoA)
+so that every registered crystal is evaluated by a single broadcast.
+"""
+_N_POLES = 3
+
+
+def _build_sellmeier_table():
+    table = {}
+    const, A, B, linear, ranges = [], [], [], [], []
+    for name, crystal_cls in CRYSTALS.items():
+        crystal = crystal_cls()
+        rows = []
+        for axis, coeff in crystal.sellmeier.items():
+            if axis == "range":
+                continue
+            C, A_i, B_i, D = crystal._sellmeier_poles(coeff)
+            pad = _N_POLES - len(A_i)
+            rows.append(len(const))
+            const.append(C)
+            A.append(list(A_i) + [0.0] * pad)
+            B.append(list(B_i) + [0.0] * pad)
+            linear.append(D)
+            ranges.append(crystal.sellmeier["range"])
+        table[name] = np.array(rows)
+    return (table,
+            np.array(const, dtype=np.float64),
+            np.array(A, dtype=np.float64),
+            np.array(B, dtype=np.float64),
+            np.array(linear, dtype=np.float64),
+            np.array(ranges, dtype=np.float64))
+
+
+CRYSTAL_TABLE, _SELLMEIER_CONST, _SELLMEIER_A, _SELLMEIER_B, _SELLMEIER_LINEAR, _RANGE = _build_sellmeier_table()
+# strength-reduced form, as in the per-crystal kernels: n^2 = C + sum_i AB_i / (w^2 - B_i) + D * w^2
+_SELLMEIER_C = _SELLMEIER_CONST + _SELLMEIER_A.sum(axis=1)
+_SELLMEIER_AB = _SELLMEIER_A * _SELLMEIER_B
+
+
+def get_n_all(wavelength_nm):
+    """
+    Principal refractive indices of every registered crystal at once.
+
+    parameters
+    ----------------------
+    wavelength_nm: float or array-like
+
+    returns
+    ----------------------
+    np.ndarray of shape (n_rows, n_wavelengths). CRYSTAL_TABLE[name] gives the rows of
+    a crystal, in the order of its principal axes (o, e / a, b, c).
+    Entries outside a crystal's approximation range are NaN.
+    """
+    wvl = np.atleast_1d(np.asarray(wavelength_nm, dtype=np.float64)) * 1e-3  # μm
+    w2 = wvl * wvl
+    # one (rows, poles, wavelengths) block with wavelengths contiguous; the pole terms are
+    # computed in place so the whole table is a single subtract and a single divide
+    # rows outside their own range may hit a pole or a negative n^2; they are masked below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.subtract(w2, _SELLMEIER_B[:, :, np.newaxis])
+        np.divide(_SELLMEIER_AB[:, :, np.newaxis], terms, out=terms)
+        n = terms.sum(axis=1)
+        n += _SELLMEIER_C[:, np.newaxis]
+        n += _SELLMEIER_LINEAR[:, np.newaxis] * w2
+        np.sqrt(n, out=n)
+    out_of_range = (wvl < _RANGE[:, :1]) | (wvl > _RANGE[:, 1:])
+    n[out_of_range] = np.nan
+    return n
@@ -1,7 +1,12 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 setup(
     name="crystaldatabase",
     version="0.1",
     packages=find_packages(),
-)
\ No newline at end of file
+    # compiled scalar Sellmeier evaluation; setuptools cythonizes the .pyx (Cython is a build
+    # requirement in pyproject.toml), and optional=True skips it when no compiler is available
+    ext_modules=[
+        Extension("crystaldatabase._sellmeier_c", ["crystaldatabase/_sellmeier_c.pyx"], optional=True),
+    ],
+)